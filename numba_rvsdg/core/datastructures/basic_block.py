@@ -1,6 +1,6 @@
 import dis
 import ast
-from typing import Tuple, Dict, List, Optional
+from typing import ClassVar, Tuple, Dict, List, Optional
 from dataclasses import dataclass, replace, field
 
 from numba_rvsdg.core.utils import _next_inst_offset
@@ -23,6 +23,10 @@ class BasicBlock:
 
     backedges: Tuple[str]
         Backedges for this block.
+
+    is_region: bool
+        Class level flag, True only for RegionBlock. Cheaper to test than
+        the type of the block when traversing the graph.
     """
 
     name: str
@@ -31,6 +35,8 @@ class BasicBlock:
 
     backedges: Tuple[str, ...] = tuple()
 
+    is_region: ClassVar[bool] = False
+
     @property
     def is_exiting(self) -> bool:
         """Indicates whether this block is an exiting block, i.e.,
@@ -70,11 +76,11 @@ class BasicBlock:
             Ordered according to their position.
 
         """
-        acc = []
-        for j in self._jump_targets:
-            if j not in self.backedges:
-                acc.append(j)
-        return tuple(acc)
+        backedges = self.backedges
+        # Most blocks have no backedges, return the raw targets unchanged.
+        if not backedges:
+            return self._jump_targets
+        return tuple(j for j in self._jump_targets if j not in backedges)
 
     def declare_backedge(self, target: str) -> "BasicBlock":
         """Declare one of the jump targets as a backedge of this block.
@@ -188,14 +194,13 @@ class PythonBytecodeBlock(BasicBlock):
         end = self.end
         it = begin
         out = []
+        get = bcmap.get
         while it < end:
             # Python 3.11 hack: account for gaps in the bytecode sequence
-            try:
-                out.append(bcmap[it])
-            except KeyError:
-                pass
-            finally:
-                it = _next_inst_offset(it)
+            inst = get(it)
+            if inst is not None:
+                out.append(inst)
+            it = _next_inst_offset(it)
 
         return out
 
@@ -389,6 +394,8 @@ class RegionBlock(BasicBlock):
         The exiting node of the region.
     """
 
+    is_region: ClassVar[bool] = True
+
     kind: Optional[str] = None
     parent_region: Optional["RegionBlock"] = None
     header: Optional[str] = None
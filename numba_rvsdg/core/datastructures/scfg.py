@@ -6,6 +6,7 @@ from typing import (
     Tuple,
     Dict,
     List,
+    Iterable,
     Iterator,
     Optional,
     Generator,
@@ -13,7 +14,6 @@ from typing import (
     MutableMapping,
     Sized,
 )
-from textwrap import indent
 from dataclasses import dataclass, field
 from collections import deque
 
@@ -38,9 +38,15 @@ from numba_rvsdg.core.datastructures.block_names import (
     SYNTH_ASSIGN,
     SYNTH_RETURN,
 )
+from numba_rvsdg.networkx_vendored.scc import scc
 
+# Maps the block classes back to their type names, for serialization.
+_block_type_names_by_class: Dict[type, str] = {
+    v: k for k, v in block_type_names.items()
+}
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class NameGenerator:
     """Unique Name Generator.
 
@@ -56,6 +62,23 @@ class NameGenerator:
 
     kinds: dict[str, int] = field(default_factory=dict)
 
+    def _next_index(self, kind: str) -> int:
+        """Return the current index for the given kind and advance it.
+
+        Parameters
+        ----------
+        kind: str
+            The kind for which the index is requested.
+
+        Return
+        ------
+        idx: int
+            The index to be used for the next name of the given kind.
+        """
+        idx = self.kinds.get(kind, 0)
+        self.kinds[kind] = idx + 1
+        return idx
+
     def new_block_name(self, kind: str) -> str:
         """Generate a new unique name for a block of the specified kind.
 
@@ -76,15 +99,7 @@ class NameGenerator:
         name: str
             Unique name for the given kind of block.
         """
-        if kind in self.kinds.keys():
-            idx = self.kinds[kind]
-            name = str(kind) + "_block_" + str(idx)
-            self.kinds[kind] = idx + 1
-        else:
-            idx = 0
-            name = str(kind) + "_block_" + str(idx)
-            self.kinds[kind] = idx + 1
-        return name
+        return f"{kind}_block_{self._next_index(kind)}"
 
     def new_region_name(self, kind: str) -> str:
         """Generate a new unique name for a region of the specified kind.
@@ -106,15 +121,7 @@ class NameGenerator:
         name: str
             Unique name for the given kind of region.
         """
-        if kind in self.kinds.keys():
-            idx = self.kinds[kind]
-            name = str(kind) + "_region_" + str(idx)
-            self.kinds[kind] = idx + 1
-        else:
-            idx = 0
-            name = str(kind) + "_region_" + str(idx)
-            self.kinds[kind] = idx + 1
-        return name
+        return f"{kind}_region_{self._next_index(kind)}"
 
     def new_var_name(self, kind: str) -> str:
         """Generate a new unique name for a variable of the specified kind.
@@ -136,18 +143,54 @@ class NameGenerator:
         name: str
             Unique name for the given kind of variable.
         """
-        if kind in self.kinds.keys():
-            idx = self.kinds[kind]
-            name = "__scfg_" + str(kind) + "_var_" + str(idx) + "__"
-            self.kinds[kind] = idx + 1
-        else:
-            idx = 0
-            name = "__scfg_" + str(kind) + "_var_" + str(idx) + "__"
-            self.kinds[kind] = idx + 1
-        return name
+        return f"__scfg_{kind}_var_{self._next_index(kind)}__"
+
+
+class _BlockGraph(Dict[str, BasicBlock]):
+    """A dictionary of blocks that counts its modifications.
+
+    The SCFG compares this count with the one its edge bookkeeping was last
+    updated at, so that blocks written to the graph directly aren't missed.
+    """
+
+    version = 0
+
+    def __setitem__(self, key: str, value: BasicBlock) -> None:
+        self.version += 1
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key: str) -> None:
+        self.version += 1
+        super().__delitem__(key)
+
+    def __ior__(  # type: ignore[override,misc]
+        self, other: Any
+    ) -> "_BlockGraph":
+        self.version += 1
+        return super().__ior__(other)
+
+    def pop(self, *args: Any) -> Any:
+        self.version += 1
+        return super().pop(*args)
+
+    def popitem(self) -> Tuple[str, BasicBlock]:
+        self.version += 1
+        return super().popitem()
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        self.version += 1
+        return super().setdefault(key, default)
 
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        self.version += 1
+        super().update(*args, **kwargs)
 
-@dataclass(frozen=True)
+    def clear(self) -> None:
+        self.version += 1
+        super().clear()
+
+
+@dataclass(frozen=True, slots=True)
 class SCFG(Sized):
     """SCFG (Structured Control Flow Graph) class.
 
@@ -158,33 +201,86 @@ class SCFG(Sized):
     ----------
     graph: Dict[str, BasicBlock]
         A dictionary that maps names to corresponding BasicBlock objects
-        within the control flow graph.
+        within the control flow graph. The given mapping is copied into a
+        dictionary that keeps track of its modifications.
 
     name_gen: NameGenerator
         A NameGenerator object that provides unique names for blocks,
         regions, and variables.
+
+    Notes
+    -----
+    Once the graph has been queried, the SCFG keeps some bookkeeping about
+    its edges. `add_block` and `remove_blocks` keep it up to date as they
+    go, whereas any other modification of `graph` causes it to be rebuilt
+    on the next query.
     """
 
-    graph: MutableMapping[str, BasicBlock] = field(default_factory=dict)
+    graph: MutableMapping[str, BasicBlock] = field(default_factory=_BlockGraph)
 
     name_gen: NameGenerator = field(
         default_factory=NameGenerator, compare=False
     )
 
-    # This is the top-level region that this SCFG represents.
-    region: RegionBlock = field(init=False, compare=False)
+    # This is the top-level region that this SCFG represents. It is created
+    # lazily by the `region` property, since many SCFGs (e.g. the subregions
+    # of RegionBlocks) are assigned their region right after construction.
+    _region: Optional[RegionBlock] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    # Edge bookkeeping: the number of incoming edges (excluding backedges)
+    # for every jump target, the set of blocks that have none and the
+    # predecessors (including backedges) of every jump target. Built on first
+    # use and maintained incrementally by add_block and remove_blocks.
+    _in_degree: Optional[Dict[str, int]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _roots: Optional[Set[str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _preds: Optional[Dict[str, Set[str]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # The version of the graph the edge bookkeeping is up to date with.
+    _index_version: Optional[int] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self) -> None:
-        name = self.name_gen.new_region_name("meta")
-        new_region = RegionBlock(
-            name=name,
-            kind="meta",
-            header=None,
-            exiting=None,
-            parent_region=None,
-            subregion=self,
-        )
-        object.__setattr__(self, "region", new_region)
+        if not isinstance(self.graph, _BlockGraph):
+            object.__setattr__(self, "graph", _BlockGraph(self.graph))
+
+    @property
+    def region(self) -> RegionBlock:
+        """The top-level region that this SCFG represents.
+
+        If no region has been assigned, a new 'meta' region is created on
+        first access.
+
+        Returns
+        -------
+        region: RegionBlock
+            The region represented by this SCFG.
+        """
+        region = self._region
+        if region is None:
+            region = RegionBlock(
+                name=self.name_gen.new_region_name("meta"),
+                kind="meta",
+                header=None,
+                exiting=None,
+                parent_region=None,
+                subregion=self,
+            )
+            object.__setattr__(self, "_region", region)
+        return region
+
+    @region.setter
+    def region(self, region: RegionBlock) -> None:
+        # Since SCFG is frozen, this is only reachable through
+        # `object.__setattr__(scfg, "region", region)`.
+        object.__setattr__(self, "_region", region)
 
     def __getitem__(self, index: str) -> BasicBlock:
         """Access a block from the graph dictionary using the block name.
@@ -238,37 +334,53 @@ class SCFG(Sized):
             An iterator over a tuple of name and blocks (or regions)
             over the given view.
         """
-        # initialise housekeeping datastructures
+        # initialise housekeeping datastructures:
+        # A set because we only need lookup and have unique items and a deque
+        # because we need a first in, first out (FIFO) structure. Nested
+        # regions are walked with an explicit stack holding one such frame
+        # per (sub)graph, instead of recursing into the subregion iterators.
+        stack: List[Tuple[Mapping[str, BasicBlock], deque[str], Set[str]]]
+        stack = [(self.graph, deque([self._iter_head()]), set())]
+        while stack:
+            graph, to_visit, seen = stack[-1]
+            while to_visit:
+                # get the next name on the list
+                name = to_visit.popleft()
+                # if we have visited this, we skip it
+                if name in seen:
+                    continue
+                else:
+                    seen.add(name)
+                # get the corresponding block for the name
+                block = graph.get(name)
+                if block is None:
+                    # If this is outside the current graph, just disregard it.
+                    # (might be the case if inside a region and the block
+                    # being looked at is outside of the region.)
+                    continue
+                # yield the name, block combo
+                yield (name, block)
+                # add any jump_targets to the list of names to visit, they
+                # are only visited once the region below (if any) is done.
+                to_visit.extend(block.jump_targets)
+                # If this is a region, yield everything from that specific
+                # region next.
+                if block.is_region:
+                    assert isinstance(block, RegionBlock)
+                    subregion = block.subregion
+                    assert subregion is not None
+                    sub_head = subregion._iter_head()
+                    stack.append((subregion.graph, deque([sub_head]), set()))
+                    break
+            else:
+                stack.pop()
+
+    def _iter_head(self) -> str:
+        """Returns the block to start iterating the SCFG from."""
         try:
-            to_visit = [self.find_head()]
-            seen: list[str] = []
+            return self.find_head()
         except KeyError:
-            to_visit, seen = ["0"], []
-        while to_visit:
-            # get the next name on the list
-            name = to_visit.pop(0)
-            # if we have visited this, we skip it
-            if name in seen:
-                continue
-            else:
-                seen.append(name)
-            # get the corresponding block for the name
-            if name in self:
-                block = self[name]
-            else:
-                # If this is outside the current graph, just disregard it.
-                # (might be the case if inside a region and the block being
-                # looked at is outside of the region.)
-                continue
-            # yield the name, block combo
-            yield (name, block)
-            # If this is a region, recursively yield everything from that
-            # specific region.
-            if type(block) == RegionBlock:  # noqa: E721
-                assert block.subregion is not None
-                yield from block.subregion
-            # finally add any jump_targets to the list of names to visit
-            to_visit.extend(block.jump_targets)
+            return "0"
 
     @property
     def concealed_region_view(self) -> "ConcealedRegionView":
@@ -282,7 +394,7 @@ class SCFG(Sized):
         """
         return ConcealedRegionView(self)
 
-    def exclude_blocks(self, exclude_blocks: Set[str]) -> Iterator[str]:
+    def exclude_blocks(self, exclude_blocks: Iterable[str]) -> Iterator[str]:
         """Returns an iterator over the blocks in the SCFG with exclusions.
 
         Returns an iterator over all nodes (blocks) in the control flow graph
@@ -291,8 +403,9 @@ class SCFG(Sized):
 
         Parameters
         ----------
-        exclude_blocks: Set[str]
-            Set of blocks to be excluded.
+        exclude_blocks: Iterable[str]
+            Blocks to be excluded. Anything other than a set is converted to
+            one first, so that each membership test is constant time.
 
         Returns
         -------
@@ -300,8 +413,13 @@ class SCFG(Sized):
             An iterator over blocks (or regions) over the given SCFG with
             the specified blocks excluded.
         """
+        exclude = (
+            exclude_blocks
+            if isinstance(exclude_blocks, (set, frozenset))
+            else set(exclude_blocks)
+        )
         for block in self.graph:
-            if block not in exclude_blocks:
+            if block not in exclude:
                 yield block
 
     def find_head(self) -> str:
@@ -315,14 +433,80 @@ class SCFG(Sized):
         head: str
             Name of the head block of the graph.
         """
-        heads = set(self.graph.keys())
-        for name in self.graph.keys():
-            block = self.graph[name]
-            for jt in block.jump_targets:
-                heads.discard(jt)
+        if not self._edge_index_is_current():
+            self._build_edge_index()
+        heads = self._roots
+        assert heads is not None
         assert len(heads) == 1
         return next(iter(heads))
 
+    def _build_edge_index(self) -> None:
+        """Computes the edge bookkeeping used by `find_head` and
+        `find_headers_and_entries` from scratch.
+        """
+        object.__setattr__(self, "_in_degree", {})
+        object.__setattr__(self, "_roots", set())
+        object.__setattr__(self, "_preds", {})
+        link_block = self._link_block
+        for block in self.graph.values():
+            link_block(block)
+        self._update_index_version()
+
+    def _edge_index_is_current(self) -> bool:
+        """Whether the edge bookkeeping has been built and accounts for
+        every modification of the graph so far.
+        """
+        graph = self.graph
+        return (
+            self._preds is not None
+            and isinstance(graph, _BlockGraph)
+            and graph.version == self._index_version
+        )
+
+    def _update_index_version(self) -> None:
+        """Marks the edge bookkeeping as up to date with the graph."""
+        version = getattr(self.graph, "version", None)
+        object.__setattr__(self, "_index_version", version)
+
+    def _link_block(self, block: BasicBlock) -> None:
+        """Accounts for the outgoing edges of a block that has just been
+        added to the graph.
+        """
+        in_degree, roots, preds = self._in_degree, self._roots, self._preds
+        if in_degree is None or roots is None or preds is None:
+            return
+        name = block.name
+        if name not in in_degree:
+            roots.add(name)
+        for jt in block.jump_targets:
+            in_degree[jt] = in_degree.get(jt, 0) + 1
+            roots.discard(jt)
+        for jt in block._jump_targets:
+            preds.setdefault(jt, set()).add(name)
+
+    def _unlink_block(self, block: BasicBlock) -> None:
+        """Accounts for the outgoing edges of a block that is about to be
+        replaced or has just been removed from the graph.
+        """
+        in_degree, roots, preds = self._in_degree, self._roots, self._preds
+        if in_degree is None or roots is None or preds is None:
+            return
+        name = block.name
+        roots.discard(name)
+        for jt in block.jump_targets:
+            count = in_degree[jt] - 1
+            if count:
+                in_degree[jt] = count
+            else:
+                del in_degree[jt]
+                if jt in self.graph:
+                    roots.add(jt)
+        for jt in block._jump_targets:
+            jt_preds = preds[jt]
+            jt_preds.discard(name)
+            if not jt_preds:
+                del preds[jt]
+
     def compute_scc(self) -> List[Set[str]]:
         """Computes the strongly connected components (SCC) of the current
         SCFG.
@@ -338,24 +522,17 @@ class SCFG(Sized):
         components: List[Set[str]]
             A list of sets of strongly connected components/BasicBlocks.
         """
-        from numba_rvsdg.networkx_vendored.scc import scc
-
-        class GraphWrap:
-            def __init__(self, graph: Mapping[str, BasicBlock]) -> None:
-                self.graph = graph
-
-            def __getitem__(self, vertex: str) -> List[str]:
-                out = self.graph[vertex].jump_targets
-                # Exclude node outside of the subgraph
-                return [k for k in out if k in self.graph]
-
-            def __iter__(self) -> Iterator[str]:
-                return iter(self.graph.keys())
-
-        return list(scc(GraphWrap(self.graph)))  # type: ignore
+        graph = self.graph
+        # Build the adjacency lists once, excluding nodes outside of the
+        # subgraph, rather than filtering them on every visit of a vertex.
+        adjacency = {
+            name: [k for k in block.jump_targets if k in graph]
+            for name, block in graph.items()
+        }
+        return list(scc(adjacency))  # type: ignore
 
     def find_headers_and_entries(
-        self, subgraph: Set[str]
+        self, subgraph: Set[str], sort: bool = True
     ) -> Tuple[List[str], List[str]]:
         """Finds entries and headers in a given subgraph.
 
@@ -369,28 +546,36 @@ class SCFG(Sized):
         ----------
         subgraph: Set[str]
             The subgraph for which headers and entries are to be computed.
+        sort: bool
+            Whether to sort the results. Sorting makes the results
+            reproducible, callers that don't depend on the order can skip it
+            and get the blocks in the order they were discovered.
 
         Returns
         -------
-        (headers, entries): Tuple[Set[str], Set[str]]
-            A tuple consisting of two entries the set of header blocks
-            and set of entry blocks respectively.
+        (headers, entries): Tuple[List[str], List[str]]
+            A tuple consisting of two entries the list of header blocks
+            and list of entry blocks respectively.
         """
-        outside: str
-        entries: Set[str] = set()
-        headers: Set[str] = set()
-
-        for outside in self.exclude_blocks(subgraph):
-            nodes_jump_in_loop = subgraph.intersection(
-                self.graph[outside]._jump_targets
-            )
-            headers.update(nodes_jump_in_loop)
-            if nodes_jump_in_loop:
-                entries.add(outside)
+        # dicts are used as insertion ordered sets
+        entries: Dict[str, None] = {}
+        headers: Dict[str, None] = {}
+
+        if not self._edge_index_is_current():
+            self._build_edge_index()
+        preds = self._preds
+        assert preds is not None
+        # Only the predecessors of the subgraph need to be looked at, rather
+        # than every block outside of it.
+        for inside in subgraph:
+            for outside in preds.get(inside, ()):
+                if outside not in subgraph:
+                    headers[inside] = None
+                    entries[outside] = None
         # If the loop has no headers or entries, the only header is the head of
         # the CFG.
         if not headers:
-            headers = {self.find_head()}
+            headers = {self.find_head(): None}
             # If region is not meta, the current SCFG is contained in a
             # RegionBlock. The entries to the subgraph are same as entries
             # to it's parent region block's graph.
@@ -398,13 +583,17 @@ class SCFG(Sized):
                 parent_region = self.region.parent_region
                 assert parent_region is not None
                 assert parent_region.subregion is not None
-                _, entries = parent_region.subregion.find_headers_and_entries(
-                    {self.region.name}
+                parent_scfg = parent_region.subregion
+                _, parent_entries = parent_scfg.find_headers_and_entries(
+                    {self.region.name}, sort=False
                 )
-        return sorted(headers), sorted(entries)
+                entries = dict.fromkeys(parent_entries)
+        if sort:
+            return sorted(headers), sorted(entries)
+        return list(headers), list(entries)
 
     def find_exiting_and_exits(
-        self, subgraph: Set[str]
+        self, subgraph: Set[str], sort: bool = True
     ) -> Tuple[List[str], List[str]]:
         """Finds exiting and exit blocks in a given subgraph.
 
@@ -417,26 +606,35 @@ class SCFG(Sized):
         ----------
         subgraph: Set[str]
             The subgraph for which exit and exiting blocks are to be computed.
+        sort: bool
+            Whether to sort the results. Sorting makes the results
+            reproducible, callers that don't depend on the order can skip it
+            and get the blocks in the order they were discovered.
 
         Returns
         -------
-        (exiting, exits): Tuple[Set[str], Set[str]]
-            A tuple consisting of two entries the set of exiting blocks
-            and set of exit blocks respectively.
+        (exiting, exits): Tuple[List[str], List[str]]
+            A tuple consisting of two entries the list of exiting blocks
+            and list of exit blocks respectively.
         """
         inside: str
-        exiting: Set[str] = set()
-        exits: Set[str] = set()
+        graph = self.graph
+        # dicts are used as insertion ordered sets
+        exiting: Dict[str, None] = {}
+        exits: Dict[str, None] = {}
         for inside in subgraph:
+            jump_targets = graph[inside].jump_targets
             # any node inside that points outside the loop
-            for jt in self.graph[inside].jump_targets:
+            for jt in jump_targets:
                 if jt not in subgraph:
-                    exiting.add(inside)
-                    exits.add(jt)
-            # any returns
-            if self.graph[inside].is_exiting:
-                exiting.add(inside)
-        return sorted(exiting), sorted(exits)
+                    exiting[inside] = None
+                    exits[jt] = None
+            # any returns (i.e. the block is_exiting)
+            if not jump_targets:
+                exiting[inside] = None
+        if sort:
+            return sorted(exiting), sorted(exits)
+        return list(exiting), list(exits)
 
     def is_reachable_dfs(self, begin: str, end: str) -> bool:
         """Checks if the end block is reachable from the begin block in the
@@ -460,22 +658,55 @@ class SCFG(Sized):
             True if the end block is reachable from begin block
             and False otherwise.
         """
-        seen = set()
-        to_vist = list(self.graph[begin].jump_targets)
-        while True:
-            if to_vist:
-                block = to_vist.pop()
-            else:
-                return False
-
-            if block in seen:
-                continue
-            elif block == end:
+        for name in self._iter_reachable(begin):
+            if name == end:
                 return True
-            elif block not in seen:
-                seen.add(block)
-                if block in self.graph:
-                    to_vist.extend(self.graph[block].jump_targets)
+        return False
+
+    def _iter_reachable(self, begin: str) -> Iterator[str]:
+        """Yields the names of the blocks reachable from the begin block,
+        in depth-first order, each as soon as it is first seen.
+
+        begin itself is only yielded if it lies on a cycle. Blocks outside
+        of the current graph are yielded, but not traversed. begin is
+        looked up directly, so it has to be part of the graph.
+        """
+        graph = self.graph
+        # Blocks are marked as seen when they are pushed, so each block is
+        # pushed at most once.
+        seen: Set[str] = set()
+        to_visit = [graph[begin]]
+        while to_visit:
+            for jt in to_visit.pop().jump_targets:
+                if jt not in seen:
+                    seen.add(jt)
+                    yield jt
+                    if jt in graph:
+                        to_visit.append(graph[jt])
+
+    def reachable_from(self, begin: str) -> Set[str]:
+        """Computes the set of all blocks reachable from the begin block in
+        the SCFG.
+
+        Both this and `is_reachable_dfs` consume the same depth-first
+        search traversal, this one without stopping early, so that multiple
+        reachability queries from the same begin block can share a single
+        traversal. `is_reachable_dfs(begin, end)` is equivalent to
+        `end in reachable_from(begin)`, in particular begin itself is only
+        included if it lies on a cycle.
+
+        Parameters
+        ----------
+        begin: str
+            The name of starting block for traversal.
+
+        Returns
+        -------
+        reachable: Set[str]
+            The names of all blocks reachable from the begin block. Blocks
+            outside of the current graph are included, but not traversed.
+        """
+        return set(self._iter_reachable(begin))
 
     def add_block(self, basic_block: BasicBlock) -> None:
         """Adds a BasicBlock object to the control flow graph.
@@ -485,7 +716,30 @@ class SCFG(Sized):
         basic_block: BasicBlock
             The basic_block parameter represents the block to be added.
         """
-        self.graph[basic_block.name] = basic_block
+        graph = self.graph
+        name = basic_block.name
+        # The edge index is only kept up to date if it already was, otherwise
+        # it is rebuilt on the next query.
+        index_is_current = self._edge_index_is_current()
+        # A block that replaces an existing one is popped and re-inserted,
+        # which moves it to the end of the graph, since the order of the
+        # blocks determines the order in which they are restructured (and
+        # hence the names that are generated).
+        old_block = graph.pop(name, None)
+        graph[name] = basic_block
+        if not index_is_current:
+            return
+        # The edge index only needs updating if the replacement has different
+        # edges, the pop and re-insert above are needed either way.
+        if (
+            old_block is None
+            or old_block._jump_targets != basic_block._jump_targets
+            or old_block.backedges != basic_block.backedges
+        ):
+            if old_block is not None:
+                self._unlink_block(old_block)
+            self._link_block(basic_block)
+        self._update_index_version()
 
     def remove_blocks(self, names: Set[str]) -> None:
         """Removes a BasicBlock object from the control flow graph.
@@ -495,8 +749,14 @@ class SCFG(Sized):
         names: Set[str]
             The set of names of BasicBlocks to be removed from the graph.
         """
+        graph = self.graph
+        if not self._edge_index_is_current():
+            for name in names:
+                del graph[name]
+            return
         for name in names:
-            del self.graph[name]
+            self._unlink_block(graph.pop(name))
+        self._update_index_version()
 
     def insert_block(
         self,
@@ -538,19 +798,38 @@ class SCFG(Sized):
         self.add_block(new_block)
         # Replace any arcs from any of predecessors to any of successors with
         # an arc through the inserted block instead.
+        successors_set = set(successors)
         for name in predecessors:
-            block = self.graph.pop(name)
-            jt = list(block.jump_targets)
+            block = self.graph[name]
+            jt = block.jump_targets
             if successors:
-                for s in successors:
-                    if s in jt:
-                        if new_name not in jt:
-                            jt[jt.index(s)] = new_name
-                        else:
-                            jt.pop(jt.index(s))
+                # The arc to the first of the successors that is a jump target
+                # is redirected to the new block (unless it already is one),
+                # the first arc to any other successor is dropped. This is done
+                # in a single pass over the jump targets.
+                jt_set = set(jt)
+                first = (
+                    None
+                    if new_name in jt_set
+                    else next((s for s in successors if s in jt_set), None)
+                )
+                handled: Set[str] = set()
+                new_targets: List[str] = []
+                for t in jt:
+                    if t in successors_set and t not in handled:
+                        handled.add(t)
+                        if t == first:
+                            new_targets.append(new_name)
+                    else:
+                        new_targets.append(t)
+                new_jt = tuple(new_targets)
             else:
-                jt.append(new_name)
-            self.add_block(block.replace_jump_targets(jump_targets=tuple(jt)))
+                new_jt = jt + (new_name,)
+            # Predecessors without an arc to any successor are re-added as
+            # they are, rather than being replaced by an identical copy.
+            if new_jt != block._jump_targets:
+                block = block.replace_jump_targets(jump_targets=new_jt)
+            self.add_block(block)
 
     def insert_SyntheticExit(
         self,
@@ -624,8 +903,10 @@ class SCFG(Sized):
         numba_rvsdg.core.datastructures.scfg.SCFG.insert_block
         """
         # TODO: needs a diagram and documentaion
+        name_gen = self.name_gen
+        successors_set = set(successors)
         # name of the variable for this branching assignment
-        branch_variable = self.name_gen.new_var_name("control")
+        branch_variable = name_gen.new_var_name("control")
         # initial value of the assignment
         branch_variable_value = 0
         # store for the mapping from variable value to name
@@ -634,12 +915,15 @@ class SCFG(Sized):
         # an arc through the to be inserted block instead.
         for name in predecessors:
             block = self.graph[name]
-            jt = list(block.jump_targets)
+            jt = block.jump_targets
+            # maps each successor to the synthetic assignment replacing it
+            replacements: Dict[str, str] = {}
             # Need to create synthetic assignments for each arc from a
             # predecessors to a successor and insert it between the predecessor
-            # and the newly created block
-            for s in sorted(set(jt).intersection(successors)):
-                synth_assign = self.name_gen.new_block_name(SYNTH_ASSIGN)
+            # and the newly created block. The arcs are visited in sorted
+            # order so that block names and branch values are reproducible.
+            for s in sorted(successors_set.intersection(jt)):
+                synth_assign = name_gen.new_block_name(SYNTH_ASSIGN)
                 variable_assignment = {}
                 variable_assignment[branch_variable] = branch_variable_value
                 synth_assign_block = SyntheticAssignment(
@@ -655,13 +939,14 @@ class SCFG(Sized):
                 # update branching variable
                 branch_variable_value += 1
                 # replace previous successor with synth_assign
-                jt[jt.index(s)] = synth_assign
-            # finally, replace the jump_targets
-            self.add_block(
-                self.graph.pop(name).replace_jump_targets(
-                    jump_targets=tuple(jt)
-                )
-            )
+                replacements[s] = synth_assign
+            # finally, replace the jump_targets in a single pass, popping the
+            # replacements so that only the first arc to a successor is
+            # replaced
+            new_jt = tuple(replacements.pop(t, t) for t in jt)
+            if new_jt != block._jump_targets:
+                block = block.replace_jump_targets(jump_targets=new_jt)
+            self.add_block(block)
         # initialize new block, which will hold the branching table
         new_block = SyntheticHead(
             name=new_name,
@@ -753,28 +1038,30 @@ class SCFG(Sized):
         solo_exit_name: str
             the name of the unique exit block in the modified SCFG.
         """
-        if len(tails) == 1 and len(exits) == 1:
+        multiple_tails, multiple_exits = len(tails) >= 2, len(exits) >= 2
+        if not multiple_tails and not multiple_exits:
             # no-op
             solo_tail_name = next(iter(tails))
             solo_exit_name = next(iter(exits))
             return solo_tail_name, solo_exit_name
 
-        if len(tails) == 1 and len(exits) == 2:
+        if not multiple_tails and multiple_exits:
             # join only exits
             solo_tail_name = next(iter(tails))
             solo_exit_name = self.name_gen.new_block_name(SYNTH_EXIT)
             self.insert_SyntheticExit(solo_exit_name, tails, exits)
             return solo_tail_name, solo_exit_name
 
-        if len(tails) >= 2 and len(exits) == 1:
+        if multiple_tails and not multiple_exits:
             # join only tails
             solo_tail_name = self.name_gen.new_block_name(SYNTH_TAIL)
             solo_exit_name = next(iter(exits))
             self.insert_SyntheticTail(solo_tail_name, tails, exits)
             return solo_tail_name, solo_exit_name
 
-        if len(tails) >= 2 and len(exits) >= 2:
-            # join both tails and exits
+        if multiple_tails and multiple_exits:
+            # join both tails and exits, the synthetic tail jumps to all the
+            # exits, so they still need to be joined after it
             solo_tail_name = self.name_gen.new_block_name(SYNTH_TAIL)
             solo_exit_name = self.name_gen.new_block_name(SYNTH_EXIT)
             self.insert_SyntheticTail(solo_tail_name, tails, exits)
@@ -784,14 +1071,17 @@ class SCFG(Sized):
         assert False, "unreachable"
 
     @staticmethod
-    def bcmap_from_bytecode(bc: dis.Bytecode) -> Dict[int, dis.Instruction]:
+    def bcmap_from_bytecode(
+        bc: Iterable[dis.Instruction],
+    ) -> Dict[int, dis.Instruction]:
         """Static method that creates a bytecode map from a `dis.Bytecode`
-        object.
+        object or any other iterable of instructions.
 
         Parameters
         ----------
-        bc: dis.Bytecode
-            The ByteCode object to be converted.
+        bc: Iterable[dis.Instruction]
+            The instructions to be converted, typically a `dis.Bytecode`
+            object.
 
         Return
         ------
@@ -991,10 +1281,9 @@ class SCFGIO:
             Dictionary of block names in YAML string corresponding to their
             representation/unique name IDs in the SCFG.
         """
-        block_ref_dict = {}
-        for key, block in graph_dict["blocks"].items():
-            assert block["type"] in block_types
-            block_ref_dict[key] = key
+        blocks = graph_dict["blocks"]
+        assert all(block["type"] in block_types for block in blocks.values())
+        block_ref_dict = {key: key for key in blocks}
 
         outer_graph = SCFGIO.find_outer_graph(graph_dict)
         assert len(outer_graph) > 0
@@ -1111,29 +1400,35 @@ class SCFGIO:
             A YAML string representing the SCFG.
         """
         # Convert to yaml
-        ys = ""
-
         graph_dict = SCFGIO.to_dict(scfg)
 
         blocks = graph_dict["blocks"]
         edges = graph_dict["edges"]
         backedges = graph_dict["backedges"]
-
-        ys += "\nblocks:\n"
-        for b in sorted(blocks):
-            ys += indent(f"'{b}':\n", " " * 8)
+        sorted_blocks = sorted(blocks)
+
+        # Every entry is a single line, so the indentation is prefixed
+        # directly instead of having `textwrap.indent` re-scan each string.
+        # The lines are collected in a list and joined once at the end.
+        block_indent = " " * 8
+        attr_indent = " " * 12
+        ys: List[str] = []
+
+        ys.append("\nblocks:\n")
+        for b in sorted_blocks:
+            ys.append(f"{block_indent}'{b}':\n")
             for k, v in blocks[b].items():
-                ys += indent(f"{k}: {v}\n", " " * 12)
+                ys.append(f"{attr_indent}{k}: {v}\n")
 
-        ys += "\nedges:\n"
-        for b in sorted(blocks):
-            ys += indent(f"'{b}': {edges[b]}\n", " " * 8)
+        ys.append("\nedges:\n")
+        for b in sorted_blocks:
+            ys.append(f"{block_indent}'{b}': {edges[b]}\n")
 
-        ys += "\nbackedges:\n"
-        for b in sorted(blocks):
+        ys.append("\nbackedges:\n")
+        for b in sorted_blocks:
             if backedges[b]:
-                ys += indent(f"'{b}': {backedges[b]}\n", " " * 8)
-        return ys
+                ys.append(f"{block_indent}'{b}': {backedges[b]}\n")
+        return "".join(ys)
 
     @staticmethod
     def to_dict(scfg: "SCFG") -> Dict[str, Dict[str, Any]]:
@@ -1159,17 +1454,16 @@ class SCFGIO:
         edges, backedges = {}, {}
 
         def reverse_lookup(value: type) -> str:
-            for k, v in block_type_names.items():
-                if v == value:
-                    return k
-            else:
-                raise TypeError("Block type not found.")
+            try:
+                return _block_type_names_by_class[value]
+            except KeyError:
+                raise TypeError("Block type not found.") from None
 
         seen = set()
-        q: Set[Tuple[str, BasicBlock]] = set()
         # Order of elements doesn't matter since they're going to
-        # be sorted at the end.
-        q.update(scfg.graph.items())
+        # be sorted at the end. A list is used as a stack, since the
+        # blocks themselves aren't hashable if they contain a subregion.
+        q: List[Tuple[str, BasicBlock]] = list(scfg.graph.items())
 
         while q:
             key, value = q.pop()
@@ -1177,29 +1471,28 @@ class SCFGIO:
                 continue
             seen.add(key)
 
-            block_type = reverse_lookup(type(value))
-            blocks[key] = {"type": block_type}
+            block_info: Dict[str, Any] = {"type": reverse_lookup(type(value))}
+            blocks[key] = block_info
             if isinstance(value, RegionBlock):
                 assert value.subregion is not None
                 assert value.parent_region is not None
-                q.update(value.subregion.graph.items())
-                blocks[key]["kind"] = value.kind
-                blocks[key]["contains"] = sorted(
-                    [idx.name for idx in value.subregion.graph.values()]
-                )
-                blocks[key]["header"] = value.header
-                blocks[key]["exiting"] = value.exiting
-                blocks[key]["parent_region"] = value.parent_region.name
+                subgraph = value.subregion.graph
+                q.extend(subgraph.items())
+                block_info["kind"] = value.kind
+                block_info["contains"] = sorted(subgraph)
+                block_info["header"] = value.header
+                block_info["exiting"] = value.exiting
+                block_info["parent_region"] = value.parent_region.name
             elif isinstance(value, SyntheticBranch):
-                blocks[key]["branch_value_table"] = value.branch_value_table
-                blocks[key]["variable"] = value.variable
+                block_info["branch_value_table"] = value.branch_value_table
+                block_info["variable"] = value.variable
             elif isinstance(value, SyntheticAssignment):
-                blocks[key]["variable_assignment"] = value.variable_assignment
+                block_info["variable_assignment"] = value.variable_assignment
             elif isinstance(value, PythonBytecodeBlock):
-                blocks[key]["begin"] = value.begin
-                blocks[key]["end"] = value.end
-            edges[key] = sorted([i for i in value._jump_targets])
-            backedges[key] = sorted([i for i in value.backedges])
+                block_info["begin"] = value.begin
+                block_info["end"] = value.end
+            edges[key] = sorted(value._jump_targets)
+            backedges[key] = sorted(value.backedges)
 
         graph_dict = {"blocks": blocks, "edges": edges, "backedges": backedges}
 
@@ -1224,12 +1517,15 @@ class SCFGIO:
         """
         blocks = graph_dict["blocks"]
 
-        outer_blocks = set(blocks.keys())
-        for _, block_data in blocks.items():
-            if block_data.get("contains"):
-                outer_blocks.difference_update(block_data["contains"])
+        # Collect everything that is contained in a region in one pass and
+        # subtract it from the block names at the end.
+        contained: Set[str] = set()
+        for block_data in blocks.values():
+            contains = block_data.get("contains")
+            if contains:
+                contained.update(contains)
 
-        return outer_blocks
+        return blocks.keys() - contained
 
     @staticmethod
     def extract_block_info(
@@ -1268,12 +1564,12 @@ class SCFGIO:
             List of backedges of the requested block.
         """
         block_info = blocks[current_name].copy()
-        block_edges = tuple(block_ref_dict[idx] for idx in edges[current_name])
+        block_ref = block_ref_dict.__getitem__
+        block_edges = tuple(map(block_ref, edges[current_name]))
 
-        if backedges.get(current_name):
-            block_backedges = tuple(
-                block_ref_dict[idx] for idx in backedges[current_name]
-            )
+        current_backedges = backedges.get(current_name)
+        if current_backedges:
+            block_backedges = tuple(map(block_ref, current_backedges))
         else:
             block_backedges = ()
 
@@ -1290,6 +1586,8 @@ class AbstractGraphView(
     The AbstractGraphView class serves as a template for graph views.
     """
 
+    __slots__ = ()
+
     def __getitem__(self, item: str) -> BasicBlock:
         """Retrieves the value associated with the given key or name
         in the respective graph view.
@@ -1346,6 +1644,8 @@ class ConcealedRegionView(AbstractGraphView):
         is based on.
     """
 
+    __slots__ = ("scfg",)
+
     scfg: SCFG
 
     def __init__(self, scfg: SCFG) -> None:
@@ -1372,7 +1672,23 @@ class ConcealedRegionView(AbstractGraphView):
         block: BasicBlock
             The requested block.
         """
-        return self.scfg[item]
+        return self.scfg.graph[item]
+
+    def __contains__(self, item: object) -> bool:
+        """Checks if the given name exists in the underlying graph.
+
+        Parameters
+        ----------
+        item: str
+            The name of the block to be checked.
+
+        Returns
+        -------
+        result: bool
+            Returns True if a block with given name is present in the SCFG,
+            and returns False if it isn't.
+        """
+        return item in self.scfg.graph
 
     def __iter__(self) -> Iterator[str]:
         """Returns an iterator over the name of blocks in the concealed
@@ -1405,42 +1721,55 @@ class ConcealedRegionView(AbstractGraphView):
             An iterator over blocks (or regions)
         """
         # Initialise housekeeping datastructures:
-        # A set because we only need lookup and have unique items and a deque
-        # because we need a first in, first out (FIFO) structure.
-        to_visit, seen = (
-            deque([head if head else self.scfg.find_head()]),
-            set(),
-        )
-        while to_visit:
+        # A set because we only need lookup and have unique items and a list
+        # with a read index as the first in, first out (FIFO) queue. Blocks
+        # are marked as seen when they are enqueued, so each block is
+        # enqueued at most once and the list never needs to be shrunk.
+        scfg = self.scfg
+        start = head if head else scfg.find_head()
+        # Bind the graph and the bound methods used in the loop once.
+        graph_get = scfg.graph.get
+        to_visit: List[str] = [start]
+        append = to_visit.append
+        seen: Set[str] = {start}
+        mark_seen = seen.add
+        # The order is computed eagerly, which is cheaper than resuming a
+        # generator for every block.
+        order: List[str] = []
+        index = 0
+        while index < len(to_visit):
             # get the next name on the list
-            name = to_visit.popleft()
-            # if we have visited this, we skip it
-            if name in seen:
-                continue
-            else:
-                seen.add(name)
+            name = to_visit[index]
+            index += 1
             # get the corresponding block for the name (could also be a region)
-            try:
-                block = self[name]
-            except KeyError:
+            block = graph_get(name)
+            if block is None:
                 # If this is outside the current graph, just disregard it.
                 # (might be the case if inside a region and the block being
                 # looked at is outside of the region.)
                 continue
 
             # populate the to_vist
-            if type(block) == RegionBlock:  # noqa: E721
+            if block.is_region:
+                assert isinstance(block, RegionBlock)
                 # If this is a region, continue on to the exiting block, i.e.
                 # the region is presented a single fall-through block to the
                 # consumer of this iterator.
                 assert block.subregion is not None
-                to_visit.extend(block.subregion[block.exiting].jump_targets)
+                assert block.exiting is not None
+                exiting = block.subregion.graph[block.exiting]
+                jump_targets = exiting.jump_targets
             else:
                 # otherwise add any jump_targets to the list of names to visit
-                to_visit.extend(block.jump_targets)
+                jump_targets = block.jump_targets
+            for target in jump_targets:
+                if target not in seen:
+                    mark_seen(target)
+                    append(target)
 
-            # finally, yield the name
-            yield name
+            # finally, record the name
+            order.append(name)
+        return iter(order)
 
     def __len__(self) -> int:
         """Returns the number of elements in the concealed region view.
@@ -1451,4 +1780,4 @@ class ConcealedRegionView(AbstractGraphView):
             Length/ of given SCFG view (number of blocks in the concealed
             SCFG view).
         """
-        return len(self.scfg)
+        return len(self.scfg.graph)
@@ -60,9 +60,7 @@ def loop_restructure_helper(scfg: SCFG, loop: Set[str]) -> None:
         and len(exiting_blocks) == 1
         and backedge_blocks[0] == next(iter(exiting_blocks))
     ):
-        scfg.add_block(
-            scfg.graph.pop(backedge_blocks[0]).declare_backedge(loop_head)
-        )
+        scfg.add_block(scfg[backedge_blocks[0]].declare_backedge(loop_head))
         return
 
     # The synthetic exiting latch and synthetic exit need to be created
@@ -187,7 +185,7 @@ def loop_restructure_helper(scfg: SCFG, loop: Set[str]) -> None:
                     # that point to the headers, no need to add a backedge,
                     # since it will be contained in the SyntheticExitingLatch
                     # later on.
-                    block = scfg.graph.pop(name)
+                    block = scfg[name]
                     jts = list(block.jump_targets)
                     for h in headers:
                         if h in jts:
@@ -210,9 +208,7 @@ def loop_restructure_helper(scfg: SCFG, loop: Set[str]) -> None:
             # finally, replace the jump_targets for this block with the new
             # ones
             scfg.add_block(
-                scfg.graph.pop(name).replace_jump_targets(
-                    jump_targets=tuple(new_jt)
-                )
+                scfg[name].replace_jump_targets(jump_targets=tuple(new_jt))
             )
     # Add any new blocks to the loop.
     loop.update(new_blocks)
@@ -294,9 +290,11 @@ def find_branch_regions(
     doms = _doms(scfg)
     branch_regions: List[Optional[Tuple[str, Set[str]]]] = []
     jump_targets = scfg.graph[begin].jump_targets
+    # Share one traversal per jump target across all reachability queries.
+    reachable = {jt: scfg.reachable_from(jt) for jt in jump_targets}
     for bra_start in jump_targets:
         for jt in jump_targets:
-            if jt != bra_start and scfg.is_reachable_dfs(jt, bra_start):
+            if jt != bra_start and bra_start in reachable[jt]:
                 # placeholder for empty branch region
                 branch_regions.append(None)
                 break
@@ -339,9 +337,7 @@ def update_exiting(
     # Recursively updates the exiting blocks of a regionblock
     region_exiting = region_block.exiting
     assert region_block.subregion is not None
-    region_exiting_block: BasicBlock = region_block.subregion.graph.pop(
-        region_exiting
-    )
+    region_exiting_block: BasicBlock = region_block.subregion[region_exiting]
     jt = list(region_exiting_block._jump_targets)
     for idx, s in enumerate(jt):
         if s == new_region_header:
@@ -370,8 +366,10 @@ def extract_region(
     region_kind: str,
     parent_region: RegionBlock,
 ) -> None:
+    # The entries are replaced in order, which determines where they end up
+    # in the graph, so only the exiting blocks can skip sorting.
     headers, entries = scfg.find_headers_and_entries(region_blocks)
-    exiting_blocks, exit_blocks = scfg.find_exiting_and_exits(region_blocks)
+    exiting_blocks, _ = scfg.find_exiting_and_exits(region_blocks, sort=False)
     assert len(headers) == 1
     assert len(exiting_blocks) == 1
     region_header = next(iter(headers))
@@ -388,25 +386,29 @@ def extract_region(
 
     # For all entries, replace the header as a jump target
     # with the newly created region as a jump target.
+    graph = scfg.graph
     for name in entries:
         # Case in which entry is outside the given sub-graph
-        if name not in scfg.graph.keys():
+        if name not in graph:
             # If it's actually outside the graph, a check to see
             # if it's a valid assumption, is that the region that
             # the SCFG represents should not be the meta region.
             assert scfg.region.kind != "meta"
             continue
-        entry = scfg.graph.pop(name)
-        jt = list(entry._jump_targets)
-        for idx, s in enumerate(jt):
-            if s == region_header:
-                jt[idx] = region_name
-        entry = entry.replace_jump_targets(jump_targets=tuple(jt))
-        be = list(entry.backedges)
-        for idx, s in enumerate(be):
-            if s == region_header:
-                be[idx] = region_name
-        entry = entry.replace_backedges(backedges=tuple(be))
+        entry = graph[name]
+        entry = entry.replace_jump_targets(
+            jump_targets=tuple(
+                region_name if s == region_header else s
+                for s in entry._jump_targets
+            )
+        )
+        if region_header in entry.backedges:
+            entry = entry.replace_backedges(
+                backedges=tuple(
+                    region_name if s == region_header else s
+                    for s in entry.backedges
+                )
+            )
         # If the entry itself is a region, update it's
         # exiting blocks too, recursively
         if isinstance(entry, RegionBlock):
@@ -424,7 +426,7 @@ def extract_region(
         parent_region=parent_region,
     )
     scfg.remove_blocks(region_blocks)
-    scfg.graph[region_name] = region
+    scfg.add_block(region)
 
     # Set the parent region of the newly generated regional
     # graph as the current region.
@@ -3,6 +3,8 @@ SCC from https://github.com/networkx/networkx/blob/41a760273eed666e6f966cf14ea52
 
 LICENSE: https://github.com/networkx/networkx/blob/main/LICENSE.txt
 
+`scc` has since been rewritten to Pearce's variant of the algorithm, it
+produces the same components in the same order as the version above.
 """
 
 # Ignore all mypy errors since this file has been vendored.
@@ -10,45 +12,59 @@ LICENSE: https://github.com/networkx/networkx/blob/main/LICENSE.txt
 
 
 def scc(G):
-    preorder = {}
-    lowlink = {}
-    scc_found = set()
-    scc_queue = []
-    i = 0  # Preorder counter
+    # Iterative form of Pearce's space-efficient variant of Tarjan's
+    # algorithm ("A space-efficient algorithm for finding strongly connected
+    # components", 2016). A single rindex map serves as both the DFS number
+    # of active vertices and the component number of finished ones: component
+    # numbers count down from len(G) - 1 and are always larger than any
+    # active DFS number, so no separate lowlink or on-stack bookkeeping and no
+    # second pass over the neighbors is needed. Components are produced in the
+    # same order as with Tarjan's algorithm.
+    rindex = {}
+    root = {}
+    scc_stack = []
+    index = 0  # Number of active vertices
+    c = len(G) - 1  # Next component number
     for source in G:
-        if source not in scc_found:
-            queue = [source]
-            while queue:
-                v = queue[-1]
-                if v not in preorder:
-                    i = i + 1
-                    preorder[v] = i
-                done = True
-                for w in G[v]:
-                    if w not in preorder:
-                        queue.append(w)
-                        done = False
-                        break
-                if done:
-                    lowlink[v] = preorder[v]
-                    for w in G[v]:
-                        if w not in scc_found:
-                            if preorder[w] > preorder[v]:
-                                lowlink[v] = min([lowlink[v], lowlink[w]])
-                            else:
-                                lowlink[v] = min([lowlink[v], preorder[w]])
-                    queue.pop()
-                    if lowlink[v] == preorder[v]:
-                        scc = {v}
-                        while (
-                            scc_queue and preorder[scc_queue[-1]] > preorder[v]
-                        ):
-                            k = scc_queue.pop()
-                            scc.add(k)
-                        scc_found.update(scc)
-                        yield scc
-                    else:
-                        scc_queue.append(v)
+        if source in rindex:
+            continue
+        rindex[source] = index
+        index += 1
+        root[source] = True
+        work = [(source, iter(G[source]))]
+        while work:
+            v, neighbors = work[-1]
+            for w in neighbors:
+                if w not in rindex:
+                    rindex[w] = index
+                    index += 1
+                    root[w] = True
+                    work.append((w, iter(G[w])))
+                    break
+                if rindex[w] < rindex[v]:
+                    rindex[v] = rindex[w]
+                    root[v] = False
+            else:
+                work.pop()
+                if root[v]:
+                    index -= 1
+                    scc = {v}
+                    while scc_stack and rindex[v] <= rindex[scc_stack[-1]]:
+                        w = scc_stack.pop()
+                        rindex[w] = c
+                        index -= 1
+                        scc.add(w)
+                    rindex[v] = c
+                    c -= 1
+                    yield scc
+                else:
+                    scc_stack.append(v)
+                if work:
+                    # propagate to the parent, as on return from recursion
+                    u = work[-1][0]
+                    if rindex[v] < rindex[u]:
+                        rindex[u] = rindex[v]
+                        root[u] = False
 
 
 def sccr(G):
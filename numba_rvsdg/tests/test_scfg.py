@@ -155,6 +155,26 @@ class TestSCFGConversion(SCFGComparator):
             scfg, block_dict = SCFG.from_dict(case)
             self.assertDictEqual(case, scfg.to_dict(), {"0": block_dict["0"]})
 
+    def test_dict_conversion_restructured(self):
+        def foo(n):
+            c = 0
+            for i in range(n):
+                c += i
+            return c
+
+        scfg = ByteFlow.from_bytecode(foo).scfg
+        scfg.restructure()
+        graph_dict = scfg.to_dict()
+        regions = {
+            name: block
+            for name, block in graph_dict["blocks"].items()
+            if block["type"] == block_names.REGION
+        }
+        self.assertTrue(regions)
+        for block in regions.values():
+            for name in block["contains"]:
+                self.assertIn(name, graph_dict["blocks"])
+
 
 class TestSCFGIterator(SCFGComparator):
     def test_scfg_iter(self):
@@ -182,6 +202,214 @@ class TestSCFGIterator(SCFGComparator):
         self.assertEqual(expected, received)
 
 
+class TestSCFGFindHead(TestCase):
+    def test_find_head_tracks_mutations(self):
+        scfg, block_dict = SCFG.from_yaml(
+            """
+        blocks:
+            '0':
+                type: basic
+            '1':
+                type: basic
+        edges:
+            '0': ['1']
+            '1': []
+        backedges:
+        """
+        )
+        self.assertEqual(scfg.find_head(), block_dict["0"])
+        new_head = scfg.name_gen.new_block_name(block_names.BASIC)
+        scfg.add_block(
+            BasicBlock(name=new_head, _jump_targets=(block_dict["0"],))
+        )
+        self.assertEqual(scfg.find_head(), new_head)
+        scfg.remove_blocks({new_head})
+        self.assertEqual(scfg.find_head(), block_dict["0"])
+        scfg.remove_blocks({block_dict["0"]})
+        self.assertEqual(scfg.find_head(), block_dict["1"])
+
+    def test_find_head_after_direct_graph_writes(self):
+        scfg, block_dict = SCFG.from_yaml(
+            """
+        blocks:
+            '0':
+                type: basic
+            '1':
+                type: basic
+        edges:
+            '0': ['1']
+            '1': []
+        backedges:
+        """
+        )
+        self.assertEqual(scfg.find_head(), block_dict["0"])
+        scfg.graph["new"] = BasicBlock("new", _jump_targets=(block_dict["0"],))
+        self.assertEqual(scfg.find_head(), "new")
+        self.assertEqual(
+            scfg.find_headers_and_entries({block_dict["0"]}),
+            ([block_dict["0"]], ["new"]),
+        )
+        # Replacing a block directly is picked up as well.
+        scfg.graph["new"] = BasicBlock("new", _jump_targets=(block_dict["1"],))
+        self.assertEqual(
+            scfg.find_headers_and_entries({block_dict["1"]}),
+            ([block_dict["1"]], sorted([block_dict["0"], "new"])),
+        )
+        # add_block and remove_blocks work on top of direct writes.
+        del scfg.graph["new"]
+        scfg.remove_blocks({block_dict["0"]})
+        self.assertEqual(scfg.find_head(), block_dict["1"])
+
+    def test_edge_index_after_restructure(self):
+        def foo(n):
+            c = 0
+            for i in range(n):
+                if i % 2:
+                    c += i
+            return c
+
+        scfg = ByteFlow.from_bytecode(foo).scfg
+        scfg.find_head()
+        scfg.restructure()
+        for region in [scfg.region, *scfg.iter_subregions()]:
+            subregion = region.subregion
+            heads = set(subregion.graph)
+            for block in subregion.graph.values():
+                heads.difference_update(block.jump_targets)
+            self.assertEqual({subregion.find_head()}, heads)
+            for name in subregion.graph:
+                entries = sorted(
+                    outside
+                    for outside, block in subregion.graph.items()
+                    if outside != name and name in block._jump_targets
+                )
+                if entries:
+                    self.assertEqual(
+                        subregion.find_headers_and_entries({name}),
+                        ([name], entries),
+                    )
+
+
+class TestSCFGBlockOrder(TestCase):
+    def test_restructure_block_order(self):
+        # The order in which blocks are added and replaced determines the
+        # regions (and names) that restructuring produces.
+        scfg, _ = SCFG.from_yaml(
+            """
+        blocks:
+            '0':
+                type: basic
+            '1':
+                type: basic
+            '2':
+                type: basic
+            '3':
+                type: basic
+            '4':
+                type: basic
+            '5':
+                type: basic
+            '6':
+                type: basic
+        edges:
+            '0': ['1']
+            '1': ['6', '5']
+            '2': ['1', '4']
+            '3': ['2', '5', '6']
+            '4': ['3']
+            '5': ['3', '2']
+            '6': []
+        backedges:
+        """
+        )
+        scfg.restructure()
+        regions = {
+            region.name: region.subregion for region in scfg.iter_subregions()
+        }
+        self.assertEqual(list(regions["head_region_5"].graph), ["3"])
+        self.assertEqual(list(regions["head_region_6"].graph), ["2"])
+        self.assertEqual(
+            list(regions["loop_region_1"].graph),
+            [
+                "head_region_2",
+                "branch_region_4",
+                "branch_region_5",
+                "tail_region_2",
+            ],
+        )
+        self.assertEqual(
+            list(regions["branch_region_9"].graph),
+            [
+                "head_region_6",
+                "branch_region_14",
+                "branch_region_15",
+                "tail_region_6",
+            ],
+        )
+
+
+class TestSCFGReachability(TestCase):
+    def test_reachable_from(self):
+        scfg, block_dict = SCFG.from_yaml(
+            """
+        blocks:
+            '0':
+                type: basic
+            '1':
+                type: basic
+            '2':
+                type: basic
+            '3':
+                type: basic
+        edges:
+            '0': ['1', '2']
+            '1': ['3']
+            '2': ['1']
+            '3': []
+        backedges:
+        """
+        )
+        names = {block_dict[k]: k for k in block_dict}
+        self.assertEqual(
+            {names[n] for n in scfg.reachable_from(block_dict["2"])},
+            {"1", "3"},
+        )
+        # Close a cycle through '2' and add an arc to a block outside of
+        # the graph.
+        scfg.add_block(
+            scfg[block_dict["3"]].replace_jump_targets(
+                jump_targets=(block_dict["2"], "outside")
+            )
+        )
+        for begin in block_dict.values():
+            reachable = scfg.reachable_from(begin)
+            for end in [*block_dict.values(), "outside"]:
+                self.assertEqual(
+                    scfg.is_reachable_dfs(begin, end), end in reachable
+                )
+        self.assertEqual(
+            {names.get(n, n) for n in scfg.reachable_from(block_dict["2"])},
+            {"1", "2", "3", "outside"},
+        )
+
+    def test_is_reachable_dfs_missing_begin(self):
+        scfg, block_dict = SCFG.from_yaml(
+            """
+        blocks:
+            '0':
+                type: basic
+            '1':
+                type: basic
+        edges:
+            '0': ['1']
+            '1': []
+        backedges:
+        """
+        )
+        with self.assertRaises(KeyError):
+            scfg.is_reachable_dfs("missing", block_dict["1"])
+
+
 class TestConcealedRegionView(TestCase):
     def setUp(self):
         def foo(n):
@@ -251,6 +251,29 @@ class TestInsertBlock(SCFGComparator):
             },
         )
 
+    def test_redirected_arc_position(self):
+        # The arc through the new block takes the position of the arc to the
+        # first of the given successors.
+        scfg = SCFG()
+        scfg.add_block(BasicBlock(name="P", _jump_targets=("A", "X", "B")))
+        for name in ("A", "X", "B"):
+            scfg.add_block(BasicBlock(name=name))
+        scfg.insert_block("NEW", ["P"], ["B", "A"], BasicBlock)
+        self.assertEqual(scfg["P"]._jump_targets, ("X", "NEW"))
+        self.assertEqual(scfg["NEW"]._jump_targets, ("B", "A"))
+
+    def test_control_blocks_duplicate_targets(self):
+        # Only the first arc to a successor is replaced by a synthetic
+        # assignment.
+        scfg = SCFG()
+        scfg.add_block(BasicBlock(name="P", _jump_targets=("S", "X", "S")))
+        for name in ("S", "X"):
+            scfg.add_block(BasicBlock(name=name))
+        scfg.insert_block_and_control_blocks("NEW", ["P"], ["S"])
+        (synth_assign,) = scfg["P"]._jump_targets[:1]
+        self.assertEqual(scfg["P"]._jump_targets, (synth_assign, "X", "S"))
+        self.assertEqual(scfg[synth_assign]._jump_targets, ("NEW",))
+
 
 class TestJoinReturns(SCFGComparator):
     def test_two_returns(self):
@@ -382,6 +405,66 @@ class TestJoinTailsAndExits(SCFGComparator):
             solo_exit_name,
         )
 
+    def test_join_tails_and_exits_case_01_more_exits(self):
+        original = """
+        blocks:
+            '0':
+                type: basic
+            '1':
+                type: basic
+            '2':
+                type: basic
+            '3':
+                type: basic
+            '4':
+                type: basic
+        edges:
+            '0': ['1', '2', '3']
+            '1': ['4']
+            '2': ['4']
+            '3': ['4']
+            '4': []
+        backedges:
+        """
+        original_scfg, block_dict = SCFG.from_yaml(original)
+        expected = """
+        blocks:
+            '0':
+                type: basic
+            '1':
+                type: basic
+            '2':
+                type: basic
+            '3':
+                type: basic
+            '4':
+                type: basic
+            '5':
+                type: basic
+        edges:
+            '0': ['5']
+            '1': ['4']
+            '2': ['4']
+            '3': ['4']
+            '4': []
+            '5': ['1', '2', '3']
+        backedges:
+        """
+        expected_scfg, _ = SCFG.from_yaml(expected)
+
+        tails = (block_dict["0"],)
+        exits = (block_dict["1"], block_dict["2"], block_dict["3"])
+        solo_tail_name, solo_exit_name = original_scfg.join_tails_and_exits(
+            tails, exits
+        )
+
+        self.assertSCFGEqual(expected_scfg, original_scfg)
+        self.assertEqual(block_dict["0"], solo_tail_name)
+        self.assertEqual(
+            expected_scfg.name_gen.new_block_name(block_names.SYNTH_EXIT),
+            solo_exit_name,
+        )
+
     def test_join_tails_and_exits_case_02_01(self):
         original = """
         blocks: